@@ -0,0 +1,156 @@
+"""
+Command line entry point.
+
+Only the standard library and `config` are imported at module level; each
+subcommand imports its own dependencies (pandas, numpy, torch, transformers,
+matplotlib) so that the lightweight commands start quickly.
+"""
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from pathlib import Path
+from .config import (
+    FAILED_GAMES_FILE_PATH,
+    GAME_FAMILIES,
+    GAMES_FILE_PATH,
+    METRICS,
+    N_ROUNDS,
+    NOISE_VALUES,
+    PARAM_SIZES,
+    PREFETCH_PARAM_SIZES,
+    PREFETCH_TRAINING_STEP_NUMBERS,
+    TRAINING_STEPS,
+)
+
+SIZE_NAMES = [size_name for size_name, _ in PARAM_SIZES]
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _confidence(value: str) -> float:
+    confidence = float(value)
+    if not 0 < confidence < 1:
+        raise ArgumentTypeError(f"must be between 0 and 1 (exclusive), got {value}")
+    return confidence
+
+
+def _planned_runs(args: Namespace):
+    from .main import load_checkpoint, plan_runs
+
+    games, failed_games = load_checkpoint(args.games, args.failed_games)
+    planned_runs = plan_runs(
+        games,
+        failed_games,
+        param_sizes=[size for size in PARAM_SIZES if size[0] in args.sizes],
+        training_steps=TRAINING_STEPS,
+        noise_values=args.noise,
+        families=args.families,
+    )
+    return planned_runs, games, failed_games
+
+
+def plan(args: Namespace):
+    planned_runs, _, _ = _planned_runs(args)
+    for run in planned_runs:
+        print(f"{run.model}\t{run.checkpoint}\tnoise={run.noise}\t{run.family}")
+    print(f"{len(planned_runs)} runs pending")
+
+
+def run(args: Namespace):
+    from .main import run_games
+
+    planned_runs, games, failed_games = _planned_runs(args)
+    run_games(
+        planned_runs,
+        games,
+        failed_games,
+        games_file_path=args.games,
+        failed_games_file_path=args.failed_games,
+        n_rounds=args.n_rounds,
+    )
+
+
+def prefetch(args: Namespace):
+    from .prefetch_models import prefetch
+
+    prefetch(args.sizes, [f"step{i}" for i in args.steps], threads=args.threads)
+
+
+def analyze(args: Namespace):
+    from .analysis import add_defection_rates, load_games, summarize
+
+    print(summarize(add_defection_rates(load_games(args.data))).to_string())
+
+
+def fit(args: Namespace):
+    from .analysis import add_defection_rates, load_games
+    from .power_law import fit_power_law
+
+    fits = fit_power_law(
+        add_defection_rates(load_games(args.data)),
+        metrics=args.metrics,
+        n_resamples=args.resamples,
+        confidence=args.confidence,
+        seed=args.seed,
+    )
+    print(fits.round(4).to_string())
+
+
+def plot(args: Namespace):
+    from .plots import plot_all
+
+    rendered = plot_all(force=args.force, jobs=args.jobs)
+    for path in rendered:
+        print(f"Rendered {path}")
+    print(f"{len(rendered)} plots rendered")
+
+
+def build_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="cooperation-scaling")
+    subparsers = parser.add_subparsers(required=True)
+
+    for name, handler, help in [
+        ("run", run, "play every pending game of the sweep"),
+        ("plan", plan, "list the games of the sweep that have not been played"),
+    ]:
+        subparser = subparsers.add_parser(name, help=help)
+        subparser.set_defaults(handler=handler)
+        subparser.add_argument("--games", type=Path, default=GAMES_FILE_PATH)
+        subparser.add_argument("--failed-games", type=Path, default=FAILED_GAMES_FILE_PATH)
+        subparser.add_argument("--sizes", nargs="+", choices=SIZE_NAMES, default=SIZE_NAMES)
+        subparser.add_argument("--families", nargs="+", choices=list(GAME_FAMILIES), default=None)
+        subparser.add_argument("--noise", nargs="+", type=float, default=NOISE_VALUES)
+        subparser.add_argument("--n-rounds", type=int, default=N_ROUNDS)
+
+    subparser = subparsers.add_parser("prefetch", help="download model checkpoints to the local cache")
+    subparser.set_defaults(handler=prefetch)
+    subparser.add_argument("--sizes", nargs="+", choices=SIZE_NAMES, default=PREFETCH_PARAM_SIZES)
+    subparser.add_argument("--steps", nargs="+", type=int, default=list(PREFETCH_TRAINING_STEP_NUMBERS))
+    subparser.add_argument("--threads", type=int, default=1)
+
+    subparser = subparsers.add_parser("analyze", help="summarise efficiency and defection rates")
+    subparser.set_defaults(handler=analyze)
+    subparser.add_argument("--data", type=Path, default=GAMES_FILE_PATH, help="games CSV, relative paths resolve against data/")
+
+    subparser = subparsers.add_parser("fit", help="fit per-family power laws on params and training steps")
+    subparser.set_defaults(handler=fit)
+    subparser.add_argument("--data", type=Path, default=GAMES_FILE_PATH, help="games CSV, relative paths resolve against data/")
+    subparser.add_argument("--metrics", nargs="+", choices=METRICS, default=METRICS)
+    subparser.add_argument("--resamples", type=_positive_int, default=10_000, help="bootstrap resamples per fit")
+    subparser.add_argument("--confidence", type=_confidence, default=0.95, help="e.g. 0.95 for 95%% intervals")
+    subparser.add_argument("--seed", type=int, default=0)
+
+    subparser = subparsers.add_parser("plot", help="render plots whose input data changed")
+    subparser.set_defaults(handler=plot)
+    subparser.add_argument("--force", action="store_true", help="render every plot, e.g. after upgrading matplotlib or seaborn")
+    subparser.add_argument("--jobs", type=_positive_int, default=None, help="worker processes (default: one per CPU)")
+
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).parent.parent
+DATA_PATH = ROOT_PATH / "data"
+PLOTS_PATH = ROOT_PATH / "plots"
+MODEL_CACHE_PATH = ROOT_PATH / ".model_cache"
+
+# Game results: the original noiseless sweep, and the noisy sweep `run` extends
+NOISELESS_GAMES_FILE_PATH = DATA_PATH / "games.csv"
+GAMES_FILE_PATH = DATA_PATH / "games_noisy.csv"
+FAILED_GAMES_FILE_PATH = DATA_PATH / "failed_games_noisy.csv"
+
+# Pythia setup
+HF_USER = "EleutherAI"
+PARAM_SIZES = [
+    # Only includes the deduped models
+    ("70M", 70_426_624),
+    ("160M", 162_322_944),
+    ("410M", 405_334_016),
+    ("1B", 1_011_781_632),
+    ("1.4B", 1_414_647_808),
+    ("2.8B", 2_775_208_960),
+    ("6.9B", 6_857_302_016),
+    ("12B", 11_846_072_320),
+]
+TRAINING_STEP_NUMBERS = (
+    # Initial steps
+    # [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
+    # Then every 1000 steps, from step1000 to step143000 (main)
+    # Subset selected:
+    range(11000, 143000, 2000)
+)
+TRAINING_STEPS = [(f"step{i}", i) for i in TRAINING_STEP_NUMBERS]
+
+# Prefetching only covers the largest models, at a coarser stride
+PREFETCH_PARAM_SIZES = ["6.9B", "12B"]
+PREFETCH_TRAINING_STEP_NUMBERS = range(11000, 143000, 12000)
+
+# Game setup
+N_ROUNDS = 10
+NOISE_VALUES = [0.2]
+OPTION_J = "Option J"
+OPTION_F = "Option F"
+GAME_FAMILIES = {
+    "Win-win": [
+        [(1, 1), (4, 4)],  # JJ, JF
+        [(1, 1), (2, 2)],  # FJ, FF
+    ],
+    "Prisoner's Dilemma": [
+        [(4, 4), (3, 1)],  # JJ, JF
+        [(1, 3), (2, 2)],  # FJ, FF
+    ],
+    "Unfair": [
+        [(4, 4), (1, 3)],  # JJ, JF
+        [(1, 1), (2, 2)],  # FJ, FF
+    ],
+    "Biased": [
+        [(4, 4), (2, 3)],  # JJ, JF
+        [(1, 1), (3, 2)],  # FJ, FF
+    ],
+    "Second Best": [
+        [(1, 1), (4, 2)],  # JJ, JF
+        [(3, 3), (2, 4)],  # FJ, FF
+    ],
+}
+
+# Power law fits
+METRICS = ["efficiency", "defection_rate_p1", "defection_rate_p2"]
+TERMS = ["intercept", "params", "training_steps"]
+
+
+def model_id(size_name: str) -> str:
+    return f"{HF_USER}/pythia-{size_name}-deduped"
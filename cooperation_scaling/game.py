@@ -1,23 +1,22 @@
-from typing import Generator, TypeAlias, Literal
-from torch import device, cuda
+from typing import Generator
+from torch import cuda
 from contextlib import contextmanager
 from transformers import GPTNeoXForCausalLM, AutoTokenizer
 from pathlib import Path
-from functools import cache
 from dataclasses import dataclass
-from prompts import (
+from .config import MODEL_CACHE_PATH
+from .prompts import (
+    OPTION,
     game_prompt,
     completion_to_option,
     insist_on_answer_prompt,
 )
 import random
 
-ROOT_PATH = Path(__file__).parent.parent
-
-assert cuda.is_available()
 
 @contextmanager
-def get_model_and_tokenizer(model_id: str, revision: str, cache_dir: Path = ROOT_PATH / ".model_cache") -> Generator[tuple[GPTNeoXForCausalLM, AutoTokenizer], None, None]:
+def get_model_and_tokenizer(model_id: str, revision: str, cache_dir: Path = MODEL_CACHE_PATH) -> Generator[tuple[GPTNeoXForCausalLM, AutoTokenizer], None, None]:
+    assert cuda.is_available()
     cache_dir = cache_dir / model_id / revision
     model = GPTNeoXForCausalLM.from_pretrained(
         model_id,
@@ -53,9 +52,6 @@ class Player:
         return prompt_model(input, self.model, self.tokenizer)
 
 
-OPTION: TypeAlias = Literal["J", "F"]
-
-
 def prompt_player(player: Player, prompt: str, option_j: str, option_f: str):
     move = completion_to_option(
         player.prompt(prompt),
@@ -1,7 +1,19 @@
-from typing import TypedDict
-from game import play_game, OPTION
-import pandas as pd
+from typing import NamedTuple, TypedDict
 from pathlib import Path
+import pandas as pd
+from .config import (
+    FAILED_GAMES_FILE_PATH,
+    GAME_FAMILIES,
+    GAMES_FILE_PATH,
+    N_ROUNDS,
+    NOISE_VALUES,
+    OPTION_F,
+    OPTION_J,
+    PARAM_SIZES,
+    TRAINING_STEPS,
+    model_id,
+)
+from .prompts import OPTION
 
 
 class GameRun(TypedDict):
@@ -27,64 +39,19 @@ class FailedGameRun(TypedDict):
     family: str
 
 
-ROOT_PATH = Path(__file__).parent.parent
-DATA_PATH = ROOT_PATH / "data"
-
-# Pythia setup
-PARAM_SIZES = [
-    # Only includes the deduped models
-    ("70M", 70_426_624),
-    ("160M", 162_322_944),
-    ("410M", 405_334_016),
-    ("1B", 1_011_781_632),
-    ("1.4B", 1_414_647_808),
-    ("2.8B", 2_775_208_960),
-    ("6.9B", 6_857_302_016),
-    ("12B", 11_846_072_320),
-]
-TRAINING_STEP_NUMBERS = (
-    # Initial steps
-    # [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
-    # Then every 1000 steps, from step1000 to step143000 (main)
-    # Subset selected:
-    range(11000, 143000, 2000)
-)
-TRAINING_STEPS = [(f"step{i}", i) for i in TRAINING_STEP_NUMBERS]
-NOISE_VALUES = [0.2]
-HF_USER = "EleutherAI"
-GAME_FAMILIES = {
-    "Win-win": [
-        [(1, 1), (4, 4)],  # JJ, JF
-        [(1, 1), (2, 2)],  # FJ, FF
-    ],
-    "Prisoner's Dilemma": [
-        [(4, 4), (3, 1)],  # JJ, JF
-        [(1, 3), (2, 2)],  # FJ, FF
-    ],
-    "Unfair": [
-        [(4, 4), (1, 3)],  # JJ, JF
-        [(1, 1), (2, 2)],  # FJ, FF
-    ],
-    "Biased": [
-        [(4, 4), (2, 3)],  # JJ, JF
-        [(1, 1), (3, 2)],  # FJ, FF
-    ],
-    "Second Best": [
-        [(1, 1), (4, 2)],  # JJ, JF
-        [(3, 3), (2, 4)],  # FJ, FF
-    ],
-}
-
-if __name__ == "__main__":
-    models_to_use: list[tuple[int, str]] = [
-        (param_size[1], f"{HF_USER}/pythia-{param_size[0]}-deduped")
-        for param_size in PARAM_SIZES
-    ]
-    training_steps_to_use = TRAINING_STEPS
-    # Attempt to read existing game results if they exist
-    games_file_path = DATA_PATH / "games_noisy.csv"
-    failed_games_file_path = DATA_PATH / "failed_games_noisy.csv"
+class PlannedRun(NamedTuple):
+    model: str
+    params: int
+    checkpoint: str
+    training_steps: int
+    noise: float
+    family: str
+
 
+def load_checkpoint(
+    games_file_path: Path, failed_games_file_path: Path
+) -> tuple[list[GameRun], list[FailedGameRun]]:
+    # Attempt to read existing game results if they exist
     if games_file_path.exists():
         print("Resuming from games checkpoint")
         games_df = pd.read_csv(games_file_path)
@@ -99,60 +66,88 @@ if __name__ == "__main__":
     else:
         failed_games = []
 
-    completed_runs = set((game["model"], game["checkpoint"]) for game in games) | set(
-        (failed_game["model"], failed_game["checkpoint"])
-        for failed_game in failed_games
+    return games, failed_games
+
+
+def plan_runs(
+    games: list[GameRun],
+    failed_games: list[FailedGameRun],
+    param_sizes: list[tuple[str, int]] = PARAM_SIZES,
+    training_steps: list[tuple[str, int]] = TRAINING_STEPS,
+    noise_values: list[float] = NOISE_VALUES,
+    families: list[str] | None = None,
+) -> list[PlannedRun]:
+    """
+    List every run of the sweep that has no recorded result yet.
+    """
+    completed_runs = set(
+        (game["model"], game["checkpoint"], game["noise"], game["family"])
+        for game in [*games, *failed_games]
     )
-    
-    n_rounds = 10
-
-    # Run every combination of models and training steps
-    for param_size, model in models_to_use:
-        for checkpoint, training_steps in training_steps_to_use:
-            for noise in NOISE_VALUES:
-                for family_name, payoff_matrix in GAME_FAMILIES.items():
-                    if (model, checkpoint) in completed_runs:
-                        continue
-                    print(f"Running {model} with {training_steps} training steps")
-                    result = play_game(
-                        (model, checkpoint),
-                        "Option J",
-                        "Option F",
-                        payoff_matrix,
-                        n_rounds,
-                        noise=noise,
-                    )
-                    if not isinstance(result, int):
-                        # Game completed successfully
-                        games.append(
-                            {
-                                "model": model,
-                                "params": param_size,
-                                "checkpoint": checkpoint,
-                                "training_steps": training_steps,
-                                "moves": result[0],
-                                "score_p1": result[1][0],
-                                "score_p2": result[1][1],
-                                "n_rounds": n_rounds,
-                                "noise": noise,
-                                "family": family_name,
-                            }
-                        )
-                        # Save results to disk
-                        pd.DataFrame(games).to_csv(games_file_path, index=False)
-                    else:
-                        # Game could not be completed
-                        failed_games.append(
-                            {
-                                "model": model,
-                                "params": param_size,
-                                "checkpoint": checkpoint,
-                                "training_steps": training_steps,
-                                "n_rounds": n_rounds,
-                                "noise": noise,
-                                "family": family_name,
-                            }
-                        )
-                        pd.DataFrame(failed_games).to_csv(
-                            failed_games_file_path, index=False
-                        )
+
+    # Every combination of models and training steps
+    return [
+        PlannedRun(model_id(size_name), param_size, checkpoint, steps, noise, family_name)
+        for size_name, param_size in param_sizes
+        for checkpoint, steps in training_steps
+        for noise in noise_values
+        for family_name in (families or GAME_FAMILIES)
+        if (model_id(size_name), checkpoint, noise, family_name) not in completed_runs
+    ]
+
+
+def run_games(
+    planned_runs: list[PlannedRun],
+    games: list[GameRun],
+    failed_games: list[FailedGameRun],
+    games_file_path: Path = GAMES_FILE_PATH,
+    failed_games_file_path: Path = FAILED_GAMES_FILE_PATH,
+    n_rounds: int = N_ROUNDS,
+) -> None:
+    # Deferred so that planning and resuming don't need torch
+    from .game import play_game
+
+    for run in planned_runs:
+        print(f"Running {run.model} with {run.training_steps} training steps")
+        result = play_game(
+            (run.model, run.checkpoint),
+            OPTION_J,
+            OPTION_F,
+            GAME_FAMILIES[run.family],
+            n_rounds,
+            noise=run.noise,
+        )
+        if not isinstance(result, int):
+            # Game completed successfully
+            games.append(
+                {
+                    "model": run.model,
+                    "params": run.params,
+                    "checkpoint": run.checkpoint,
+                    "training_steps": run.training_steps,
+                    "moves": result[0],
+                    "score_p1": result[1][0],
+                    "score_p2": result[1][1],
+                    "n_rounds": n_rounds,
+                    "noise": run.noise,
+                    "family": run.family,
+                }
+            )
+            # Save results to disk
+            pd.DataFrame(games).to_csv(games_file_path, index=False)
+        else:
+            # Game could not be completed
+            failed_games.append(
+                {
+                    "model": run.model,
+                    "params": run.params,
+                    "checkpoint": run.checkpoint,
+                    "training_steps": run.training_steps,
+                    "n_rounds": n_rounds,
+                    "noise": run.noise,
+                    "family": run.family,
+                }
+            )
+            pd.DataFrame(failed_games).to_csv(
+                failed_games_file_path, index=False
+            )
@@ -0,0 +1,150 @@
+from pathlib import Path
+import pandas as pd
+import seaborn as sns
+from matplotlib.figure import Figure
+from .analysis import add_defection_rates, load_games
+from .config import GAMES_FILE_PATH, NOISELESS_GAMES_FILE_PATH, PLOTS_PATH
+from .report import PlotSpec, build_report
+
+
+def scatter(
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    xlabel: str,
+    ylabel: str,
+    hue: str | None = None,
+    xscale: str | None = None,
+) -> Figure:
+    fig = Figure()
+    ax = fig.add_subplot()
+    sns.scatterplot(data=data, x=x, y=y, hue=hue, ax=ax)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    if xscale:
+        ax.set_xscale(xscale)
+    return fig
+
+
+def scatter_3d(
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    z: str,
+    xlabel: str,
+    ylabel: str,
+    zlabel: str,
+    group: str | None = None,
+    label: str | None = None,
+    color: str | None = None,
+    figsize: tuple[float, float] | None = None,
+) -> Figure:
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot(projection='3d')
+
+    # Draw points for each group (e.g. each family)
+    groups = data.groupby(group) if group else [(label, data)]
+    for group_name, group_df in groups:
+        ax.scatter(
+            group_df[x],
+            group_df[y],
+            group_df[z],
+            label=group_name,
+            color=color,
+        )
+
+    # Use scientific notation for the x and y ticks
+    ax.ticklabel_format(style='sci', scilimits=(0,0), axis='x')
+    ax.ticklabel_format(style='sci', scilimits=(0,0), axis='y')
+    # Label each axis
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_zlabel(zlabel)
+    ax.legend()
+    return fig
+
+
+def plot_specs(games: pd.DataFrame, noisy_games: pd.DataFrame) -> list[PlotSpec]:
+    """
+    Every plot in the report, each with only the columns and rows it draws.
+    """
+    specs = [
+        # Params vs efficiency
+        PlotSpec(
+            Path("param_size_vs_efficiency_scatterplot.png"),
+            scatter,
+            games[["params", "efficiency"]],
+            dict(x="params", y="efficiency", xlabel="Number of parameters", ylabel="Efficiency", xscale="log"),
+        ),
+        # Training steps vs efficiency
+        PlotSpec(
+            Path("training_steps_vs_efficiency_scatterplot.png"),
+            scatter,
+            games[["training_steps", "efficiency"]],
+            dict(x="training_steps", y="efficiency", xlabel="Number of training steps", ylabel="Efficiency"),
+        ),
+        # `checkpoint` vs efficiency with `family` as hue
+        PlotSpec(
+            Path("noisy") / "params_vs_efficiency_scatterplot2.png",
+            scatter,
+            noisy_games[["training_steps", "efficiency", "family"]],
+            dict(x="training_steps", y="efficiency", hue="family", xlabel="Params", ylabel="Efficiency"),
+        ),
+        # 3D scatterplot of `params`, `training_steps`, `efficiency`, hue=`family`
+        PlotSpec(
+            Path("noisy") / "params_vs_training_steps_vs_efficiency_3d_scatterplot2.png",
+            scatter_3d,
+            noisy_games[["params", "training_steps", "efficiency", "family"]],
+            dict(
+                x="params", y="training_steps", z="efficiency", group="family",
+                xlabel="Params", ylabel="Training steps", zlabel="Efficiency (%)",
+            ),
+        ),
+        # 3D scatterplot of `params`, `training_steps`, `defection_rate_p1` for prisoner's dilemma games
+        PlotSpec(
+            Path("noisy") / "params_vs_training_steps_vs_defection_rate_p1_3d_scatterplot2.png",
+            scatter_3d,
+            noisy_games.loc[
+                noisy_games["family"] == "Prisoner's Dilemma",
+                ["params", "training_steps", "defection_rate_p1"],
+            ],
+            dict(
+                x="params", y="training_steps", z="defection_rate_p1", label="Player 1",
+                xlabel="Params", ylabel="Training steps", zlabel="Defection rate",
+            ),
+        ),
+        # Same as above with swapped axes
+        PlotSpec(
+            Path("noisy") / "params_vs_training_steps_vs_efficiency_3d_scatterplot3.png",
+            scatter_3d,
+            noisy_games[["params", "training_steps", "efficiency", "family"]],
+            dict(
+                x="training_steps", y="params", z="efficiency", group="family", figsize=(6, 6),
+                xlabel="Training steps", ylabel="Params", zlabel="Efficiency (%)",
+            ),
+        ),
+    ]
+
+    # One 3D scatter per family, with a unique color for each
+    palette = sns.color_palette("husl", n_colors=10).as_hex()
+    for i, (family_name, family_df) in enumerate(noisy_games.groupby("family")):
+        specs.append(
+            PlotSpec(
+                Path("noisy") / "families" / f"{family_name}_params_vs_training_steps_vs_efficiency_3d_scatterplot.png",
+                scatter_3d,
+                family_df[["params", "training_steps", "efficiency"]],
+                dict(
+                    x="training_steps", y="params", z="efficiency",
+                    label=family_name, color=palette[i], figsize=(6, 6),
+                    xlabel="Training steps", ylabel="Params", zlabel="Efficiency (%)",
+                ),
+            )
+        )
+
+    return specs
+
+
+def plot_all(force: bool = False, jobs: int | None = None) -> list[Path]:
+    games = load_games(NOISELESS_GAMES_FILE_PATH)
+    noisy_games = add_defection_rates(load_games(GAMES_FILE_PATH))
+    return build_report(plot_specs(games, noisy_games), PLOTS_PATH, force=force, jobs=jobs)
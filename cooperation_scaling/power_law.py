@@ -1,34 +1,199 @@
+"""
+Power law fits of game metrics on model size and training length.
+
+For each family and metric we fit
+
+    log(metric) = intercept + a * log(params) + b * log(training_steps)
+
+by least squares, with percentile confidence intervals from a bootstrap over
+games. Resamples are expressed as multinomial count weights, so all of them
+are solved at once from batched normal equations instead of one fit each.
+"""
+import warnings
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error, r2_score
-from pathlib import Path
+from .config import METRICS, TERMS
+
+
+def design_matrix(games: pd.DataFrame) -> np.ndarray:
+    return np.column_stack(
+        [
+            np.ones(len(games)),
+            np.log(games["params"].to_numpy(dtype=float)),
+            np.log(games["training_steps"].to_numpy(dtype=float)),
+        ]
+    )
+
+
+def log_metric(values: np.ndarray, floor: float | None = None) -> tuple[np.ndarray, int]:
+    """
+    Log of `values`, clipping zeros (and anything below `floor`) to `floor`.
+
+    `floor` defaults to half the smallest positive value, so a game where
+    nobody defected counts as "less than the rarest observed defection"
+    rather than as -inf. Returns the logs and how many values were clipped.
+    """
+    if floor is None:
+        positive = values[values > 0]
+        if len(positive) == 0:
+            raise ValueError("cannot fit a power law to a metric that is always zero")
+        floor = positive.min() / 2
+    return np.log(np.maximum(values, floor)), int((values < floor).sum())
+
+
+def solve_weighted(X: np.ndarray, Y: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Least squares coefficients of each column of `Y` for each row of `weights`.
+
+    `weights` has shape (resamples, games) and the result (resamples, metrics, terms).
+    Resamples whose weighted design is rank deficient (e.g. ones that miss all
+    but one model size) have no unique solution and come back as NaN.
+    """
+    n, k = X.shape
+    # Per-game outer products, so X'WX and X'WY for every resample are single matmuls
+    XX = (X[:, :, None] * X[:, None, :]).reshape(n, k * k)
+    XY = (Y[:, :, None] * X[:, None, :]).reshape(n, -1)
+    XtX = (weights @ XX).reshape(len(weights), k, k)
+    XtY = (weights @ XY).reshape(len(weights), -1, k)
+
+    solvable = np.linalg.matrix_rank(XtX) == k
+    coefficients = np.full(XtY.shape, np.nan)
+    coefficients[solvable] = np.linalg.solve(
+        XtX[solvable], XtY[solvable].transpose(0, 2, 1)
+    ).transpose(0, 2, 1)
+    return coefficients
+
+
+def bootstrap(
+    X: np.ndarray,
+    Y: np.ndarray,
+    n_resamples: int,
+    rng: np.random.Generator,
+    batch_size: int = 1000,
+) -> np.ndarray:
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be at least 1, got {n_resamples}")
+
+    n = len(X)
+    coefficients = []
+    # Batched to bound the memory of the (resamples x games) weight matrix
+    for start in range(0, n_resamples, batch_size):
+        size = min(batch_size, n_resamples - start)
+        # How many times each game is drawn in each resample
+        draws = rng.integers(0, n, size=(size, n)) + n * np.arange(size)[:, None]
+        weights = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n)
+        coefficients.append(solve_weighted(X, Y, weights.astype(float)))
+    return np.concatenate(coefficients)
+
+
+def fit_power_law(
+    games: pd.DataFrame,
+    metrics: list[str] = METRICS,
+    n_resamples: int = 10_000,
+    confidence: float = 0.95,
+    seed: int | None = 0,
+    pooled: bool = True,
+    max_clipped_fraction: float = 0.25,
+    max_dropped_fraction: float = 0.01,
+) -> pd.DataFrame:
+    """
+    Fit every family (plus all families pooled) and metric.
+
+    Returns one row per family, metric and term with the point estimate and
+    its bootstrap confidence interval, along with the number of games, how
+    many zero values were clipped, how many resamples were dropped and the
+    R² of the fit in log space.
+
+    Groups whose games don't vary in both model size and checkpoint, and
+    metrics that are zero for every game, can't be fitted: they get NaN rows
+    and a warning. Fits where more than `max_clipped_fraction` of the games
+    were clipped are reported but warned about, as their slopes mostly
+    reflect the clipping floor. Resamples that can't identify all terms are
+    left out of the confidence intervals, with a warning if more than
+    `max_dropped_fraction` of them were.
+    """
+    rng = np.random.default_rng(seed)
+    alpha = (1 - confidence) / 2
 
-ROOT_PATH = Path(__file__).parent.parent
-DATA_PATH = ROOT_PATH / "data"
+    groups = list(games.groupby("family")) if "family" in games else []
+    if pooled or not groups:
+        groups.append(("All", games))
 
-games_noisy = pd.read_csv(DATA_PATH / "games_noisy.csv")
-games_noisy['efficiency'] = (games_noisy['score_p1'] + games_noisy['score_p2']) / 40
+    rows = []
 
-X = games_noisy[['params', 'training_steps']]
-y = games_noisy['efficiency']
+    def add_rows(family_name, metric, n, n_clipped, n_dropped=0, r2=np.nan, estimate=None, ci_low=None, ci_high=None):
+        for i, term in enumerate(TERMS):
+            rows.append(
+                {
+                    "family": family_name,
+                    "metric": metric,
+                    "term": term,
+                    "estimate": np.nan if estimate is None else estimate[i],
+                    "ci_low": np.nan if ci_low is None else ci_low[i],
+                    "ci_high": np.nan if ci_high is None else ci_high[i],
+                    "n": n,
+                    "n_clipped": n_clipped,
+                    "n_dropped": n_dropped,
+                    "r2": r2,
+                }
+            )
 
-X_log = np.log(X)
-y_log = np.log(y)
+    for family_name, family_df in groups:
+        X = design_matrix(family_df)
+        n = len(X)
 
-model = LinearRegression()
-model.fit(X_log, y_log)
+        rank = np.linalg.matrix_rank(X)
+        if rank < len(TERMS):
+            warnings.warn(
+                f"{family_name}: design matrix has rank {rank} < {len(TERMS)} "
+                "(too few distinct model sizes or checkpoints), not fitting",
+                stacklevel=2,
+            )
+            for metric in metrics:
+                add_rows(family_name, metric, n, 0)
+            continue
 
-y_log_pred = model.predict(X_log)
+        logs, clipped = {}, {}
+        for metric in metrics:
+            values = family_df[metric].to_numpy(dtype=float)
+            if not (values > 0).any():
+                warnings.warn(f"{family_name}: {metric} is zero for every game, not fitting", stacklevel=2)
+                continue
+            logs[metric], clipped[metric] = log_metric(values)
+            if clipped[metric] / n > max_clipped_fraction:
+                warnings.warn(
+                    f"{family_name}: {clipped[metric]} of {n} games have zero {metric}, "
+                    "the fit mostly reflects the clipping floor",
+                    stacklevel=2,
+                )
 
-y_pred = np.exp(y_log_pred)
-mse = mean_squared_error(y, y_pred)
-r2 = r2_score(y, y_pred)
+        if logs:
+            Y = np.column_stack(list(logs.values()))
+            # All metrics of a family share the same resamples of its games
+            estimates = solve_weighted(X, Y, np.ones((1, n)))[0]
+            samples = bootstrap(X, Y, n_resamples, rng)
+            n_dropped = int(np.isnan(samples[:, 0, 0]).sum())
+            if n_dropped > max_dropped_fraction * n_resamples:
+                warnings.warn(
+                    f"{family_name}: {n_dropped} of {n_resamples} resamples were rank deficient "
+                    "and left out of the confidence intervals",
+                    stacklevel=2,
+                )
+            if n_dropped == n_resamples:
+                ci_low = ci_high = np.full(samples.shape[1:], np.nan)
+            else:
+                ci_low, ci_high = np.nanquantile(samples, [alpha, 1 - alpha], axis=0)
 
-coefficients = model.coef_
-intercept = model.intercept_
+        for metric in metrics:
+            if metric not in logs:
+                add_rows(family_name, metric, n, n)
+                continue
 
-print(f"Mean squared error: {mse:.2f}")
-print(f"R2 score: {r2:.2f}")
-print(f"Model coefficients: {coefficients}")
+            m = list(logs).index(metric)
+            y, estimate = Y[:, m], estimates[m]
+            residuals = y - X @ estimate
+            total = (y - y.mean()) @ (y - y.mean())
+            r2 = 1 - residuals @ residuals / total if total > 0 else np.nan
+            add_rows(family_name, metric, n, clipped[metric], n_dropped, r2, estimate, ci_low[m], ci_high[m])
 
+    return pd.DataFrame(rows).set_index(["family", "metric", "term"])
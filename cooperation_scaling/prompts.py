@@ -1,7 +1,9 @@
 from inspect import cleandoc
-from typing import Literal, Optional
+from typing import Literal, Optional, TypeAlias
 import re
 
+OPTION: TypeAlias = Literal["J", "F"]
+
 
 def initial_prompt(
     option_j: str,
@@ -0,0 +1,118 @@
+"""
+Incremental plot rendering.
+
+Every plot is described by a `PlotSpec`: the slice of data it draws, the
+parameters passed to its render function and where it is saved. A hash of
+those inputs is recorded in a manifest next to the plots, so rebuilding the
+report only re-renders plots whose inputs or render code changed (or whose
+file is missing).
+Stale plots are rendered in a process pool with the Agg backend.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import cache
+from hashlib import sha256
+from inspect import getsource
+from pathlib import Path
+from typing import Any, Callable
+import json
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+MANIFEST_NAME = ".manifest.json"
+
+
+@cache
+def _source(render: Callable[..., Figure]) -> str:
+    return getsource(render)
+
+
+@dataclass(frozen=True)
+class PlotSpec:
+    path: Path
+    render: Callable[..., Figure]
+    data: pd.DataFrame = field(repr=False)
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def key(self) -> str:
+        """
+        Hash of everything the rendered plot depends on.
+
+        This includes the render function's source, so editing it invalidates
+        its plots. Changes to code it calls into (e.g. seaborn) are not
+        tracked; use `force` for those.
+        """
+        digest = sha256()
+        digest.update(f"{self.render.__module__}.{self.render.__qualname__}".encode())
+        digest.update(_source(self.render).encode())
+        digest.update(json.dumps(self.params, sort_keys=True, default=str).encode())
+        digest.update(json.dumps(list(self.data.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(self.data, index=False).values.tobytes())
+        return digest.hexdigest()
+
+
+def _init_worker():
+    # Only ever called in pool workers, never in the caller's process
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render(spec: PlotSpec, output_path: Path) -> Path:
+    # Figures are created without pyplot, so nothing outlives this call
+    fig = spec.render(spec.data, **spec.params)
+    FigureCanvasAgg(fig)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(output_path)
+    return spec.path
+
+
+def build_report(
+    specs: list[PlotSpec],
+    plots_path: Path,
+    force: bool = False,
+    jobs: int | None = None,
+) -> list[Path]:
+    """
+    Render the plots in `specs` whose inputs changed since the last build.
+
+    Returns the paths (relative to `plots_path`) that were rendered.
+    """
+    manifest_path = plots_path / MANIFEST_NAME
+    manifest: dict[str, str] = (
+        json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    )
+
+    keys = {str(spec.path): spec.key() for spec in specs}
+    assert len(keys) == len(specs), "plot paths must be unique"
+
+    stale = [
+        spec
+        for spec in specs
+        if force
+        or manifest.get(str(spec.path)) != keys[str(spec.path)]
+        or not (plots_path / spec.path).exists()
+    ]
+
+    rendered: list[Path] = []
+    try:
+        if len(stale) == 1 or jobs == 1:
+            # Not worth starting a pool
+            for spec in stale:
+                rendered.append(_render(spec, plots_path / spec.path))
+        elif stale:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+                futures = [pool.submit(_render, spec, plots_path / spec.path) for spec in stale]
+                for future in as_completed(futures):
+                    rendered.append(future.result())
+    finally:
+        # Rebuilt from the current specs, so removed plots drop out. Plots that
+        # were stale and failed to render are left out and retried next time.
+        fresh = set(keys) - {str(spec.path) for spec in stale}
+        fresh |= {str(path) for path in rendered}
+        manifest = {path: keys[path] for path in keys if path in fresh}
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    return rendered